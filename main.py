@@ -1,36 +1,111 @@
 # main.py
 from src.pdf_processor import PDFProcessor
 from src.search_engine import SearchEngine
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import logging
 
+try:
+    from prompt_toolkit import PromptSession
+    HAS_PROMPT_TOOLKIT = True
+except ImportError:
+    HAS_PROMPT_TOOLKIT = False
+
+# Speculative search: start embedding the query while the user is still
+# typing, so the answer is usually cached by the time they hit Enter
+SPECULATE_MIN_CHARS = 4
+SPECULATE_DEBOUNCE_SECS = 0.2
+
+class QueryPrompt:
+    """Prompt that speculatively runs searches as the user types.
+
+    After each keystroke (once the query is at least SPECULATE_MIN_CHARS
+    long) a short debounce timer starts; if the text is still unchanged
+    when it fires, the search is submitted in the background. On Enter,
+    an in-flight speculative result is reused instead of re-querying.
+    Falls back to plain input() when prompt_toolkit is unavailable.
+    """
+
+    def __init__(self, search_engine):
+        self.search_engine = search_engine
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        # Guards futures: _speculate runs on timer threads and search on
+        # the main thread, and a late timer must not outlive a clear()
+        self._lock = threading.Lock()
+        self.futures = {}
+        self._timer = None
+        if HAS_PROMPT_TOOLKIT:
+            self.session = PromptSession()
+            self.session.default_buffer.on_text_changed += self._on_text_changed
+
+    def _on_text_changed(self, buffer):
+        text = buffer.text.strip()
+        if self._timer is not None:
+            self._timer.cancel()
+        if len(text) >= SPECULATE_MIN_CHARS:
+            self._timer = threading.Timer(
+                SPECULATE_DEBOUNCE_SECS, self._speculate, args=(text,)
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _speculate(self, text):
+        with self._lock:
+            if text not in self.futures:
+                self.futures[text] = self.executor.submit(
+                    self.search_engine.search, text
+                )
+
+    def read_query(self, message):
+        # Stripped here so speculative futures (keyed on the stripped
+        # buffer text) and the Enter path share one key
+        if HAS_PROMPT_TOOLKIT:
+            return self.session.prompt(message).strip()
+        return input(message).strip()
+
+    def search(self, query):
+        # Drop stale speculative work; pending futures are cancelled,
+        # running ones finish and just warm the cache
+        with self._lock:
+            future = self.futures.pop(query, None)
+            for stale in self.futures.values():
+                stale.cancel()
+            self.futures.clear()
+
+        if future is not None and not future.cancelled():
+            return future.result()
+        return self.search_engine.search(query)
+
 def main():
     # Initialize PDF processor and process documents
     # processor = PDFProcessor(batch_size=500)
-    
+
     # processor.process_directory()
-    
+
     # Initialize search engine
     search_engine = SearchEngine()
-    
+
     # Get total documents indexed
     doc_count = search_engine.get_document_count()
     print(f"\nTotal documents indexed: {doc_count}")
-    
+
+    prompt = QueryPrompt(search_engine)
+
     # Interactive search loop
     while True:
-        query = input("\nEnter your search query (or 'quit' to exit): ")
+        query = prompt.read_query("\nEnter your search query (or 'quit' to exit): ")
         if query.lower() == 'quit':
             break
-            
-        results = search_engine.search(query)
-        
+
+        results = prompt.search(query)
+
         if not results:
             print("No matching documents found.")
             continue
-            
+
         print("\nSearch Results:")
         print("-" * 80)
-        
+
         for idx, result in enumerate(results, 1):
             print(f"\nResult {idx} (Relevance: {result['relevance_score']}%):")
             print(f"File: {result['file_name']}")
@@ -39,4 +114,4 @@ def main():
             print("-" * 80)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
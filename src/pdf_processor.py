@@ -1,10 +1,20 @@
-import PyPDF2
-import weaviate
+import pypdfium2 as pdfium
+import tiktoken
+from weaviate.classes.aggregate import GroupByAggregate
+from weaviate.classes.query import Filter
+from weaviate.exceptions import WeaviateBaseError
 from tqdm import tqdm
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import queue
+import os
+import sys
 import logging
-import traceback
 from . import config
+from .weaviate_client import get_client
+from .search_engine import clear_search_cache
+import gzip
 import json
 import time
 from datetime import datetime
@@ -18,165 +28,377 @@ logging.basicConfig(
     ]
 )
 
+def _chunk_tokens(encoding, text, chunk_size_tokens, chunk_overlap):
+    """Split text into token-sized chunks with overlap.
+
+    Module-level so extraction worker processes can chunk without a
+    PDFProcessor (and its Weaviate client) in the subprocess.
+    """
+    tokens = encoding.encode(text)
+    chunks = []
+    step = chunk_size_tokens - chunk_overlap
+
+    for start in range(0, len(tokens), step):
+        window = tokens[start:start + chunk_size_tokens]
+        chunks.append(encoding.decode(window))
+        if start + chunk_size_tokens >= len(tokens):
+            break
+
+    return chunks
+
+
+def _extract_pdf_worker(task_queue, result_queue, chunk_size_tokens, chunk_overlap):
+    """Extract and chunk whole PDFs from a task queue into a result queue.
+
+    Runs in a separate process. Pulls paths until it sees the None
+    sentinel, pushes ("chunk", content, page, file, chunk_no) tuples plus
+    a ("file_done", name, ok) marker per file, and echoes one None back
+    so the consumer knows this worker has drained.
+    """
+    encoding = tiktoken.get_encoding("cl100k_base")
+
+    while True:
+        pdf_path = task_queue.get()
+        if pdf_path is None:
+            result_queue.put(None)
+            break
+
+        file_name = Path(pdf_path).name
+        pdf = None
+        ok = True
+        try:
+            pdf = pdfium.PdfDocument(pdf_path)
+            for page_num in range(len(pdf)):
+                text = pdf[page_num].get_textpage().get_text_range()
+                if not text or not text.strip():
+                    continue
+
+                chunks = _chunk_tokens(encoding, text, chunk_size_tokens, chunk_overlap)
+                for chunk_num, chunk in enumerate(chunks):
+                    if chunk.strip():
+                        result_queue.put(
+                            ("chunk", chunk, page_num + 1, file_name, chunk_num + 1)
+                        )
+        except (pdfium.PdfiumError, OSError) as e:
+            ok = False
+            logging.error(f"Error extracting {file_name}: {str(e)}")
+        except Exception:
+            ok = False
+            logging.error(f"Unexpected error extracting {file_name}", exc_info=True)
+        finally:
+            if pdf is not None:
+                pdf.close()
+            result_queue.put(("file_done", file_name, ok))
+
+
+def _extract_page(task):
+    """Extract text from a single PDF page in a worker process.
+
+    Document handles don't pickle, so each worker reopens the file and
+    pulls out just its page. PDFium's C++ text extraction is several
+    times faster per page than pure-Python readers.
+    """
+    pdf_path, page_num = task
+    pdf = None
+    try:
+        pdf = pdfium.PdfDocument(pdf_path)
+        return page_num, pdf[page_num].get_textpage().get_text_range()
+    except (pdfium.PdfiumError, OSError, IndexError) as e:
+        logging.error(f"Error extracting page {page_num + 1} from {pdf_path}: {str(e)}")
+        return page_num, None
+    finally:
+        if pdf is not None:
+            pdf.close()
+
+
 class PDFProcessor:
-    def __init__(self, batch_size=50):
-        self.client = weaviate.Client(
-            url=config.WEAVIATE_HOST,
-            startup_period=30
-        )
+    def __init__(self, batch_size=None, chunk_size_tokens=384, chunk_overlap=64,
+                 max_workers=8):
+        # Validate up front: an overlap at or above the window size
+        # would otherwise surface per PDF as an opaque range() error
+        # deep inside the extraction workers
+        if not 0 <= chunk_overlap < chunk_size_tokens:
+            raise ValueError(
+                f"chunk_overlap must satisfy 0 <= chunk_overlap < "
+                f"chunk_size_tokens, got overlap={chunk_overlap} and "
+                f"chunk_size_tokens={chunk_size_tokens}"
+            )
+        self.client = get_client()
+        # None means let the v4 dynamic batcher tune itself; an integer
+        # forces a fixed batch size
         self.batch_size = batch_size
+        self._flush_size = batch_size if batch_size else 500
+        self.max_workers = max_workers
+        self.chunk_size_tokens = chunk_size_tokens
+        self.chunk_overlap = chunk_overlap
+        self._encoding = tiktoken.get_encoding("cl100k_base")
         self.backup_dir = Path('weaviate_backups')
         self.backup_dir.mkdir(exist_ok=True)
         self._setup_schema()
-        
+
+    def _batch_context(self):
+        """Return a batching context: dynamic unless a size was forced."""
+        if self.batch_size is None:
+            return self.client.batch.dynamic()
+        return self.client.batch.fixed_size(
+            batch_size=self.batch_size,
+            concurrent_requests=max(2, self.batch_size // 100)
+        )
+
     def _setup_schema(self):
         """Initialize the Weaviate schema if it doesn't exist."""
         try:
-            try:
-                self.client.schema.get("Document")
+            if self.client.collections.exists("Document"):
                 logging.info("Schema already exists")
-            except:
-                self.client.schema.create_class(config.SCHEMA_CONFIG)
+            else:
+                self.client.collections.create_from_dict(config.SCHEMA_CONFIG)
                 logging.info("Schema created successfully")
-        except Exception as e:
+        except WeaviateBaseError as e:
             logging.error(f"Schema setup error: {str(e)}")
             raise
     
-    def _chunk_text(self, text: str, chunk_size: int = 5000) -> list:
-        """Split text into larger chunks for better context."""
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        current_size = 0
-        
-        for word in words:
-            current_size += len(word) + 1
-            if current_size > chunk_size:
-                if current_chunk:
-                    chunks.append(' '.join(current_chunk))
-                current_chunk = [word]
-                current_size = len(word)
-            else:
-                current_chunk.append(word)
-                
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
-            
-        return chunks
+    def _chunk_text(self, text: str) -> list:
+        """Split text into token-sized chunks with overlap.
+
+        Character-based windows ignore the embedding model's token limit,
+        wasting tokens or truncating; tokenizing once and sliding a
+        chunk_size_tokens window (with chunk_overlap tokens of context
+        between neighbours) yields correctly sized chunks.
+        """
+        return _chunk_tokens(self._encoding, text,
+                             self.chunk_size_tokens, self.chunk_overlap)
 
     def _create_backup(self, filename: str):
-        """Create a backup of processed documents for a specific file."""
+        """Create a backup of processed documents for a specific file.
+
+        Fallback for backing up one file; directory runs use
+        _create_all_backups to avoid a query per file.
+        """
         try:
-            # Query all chunks for this file with all properties
-            result = (
-                self.client.query
-                .get("Document", ["content", "page_number", "file_name", "chunk_number"])  # Correct syntax for fields
-                .with_additional(["id"])
-                .with_where({
-                    "path": ["file_name"],
-                    "operator": "Equal",
-                    "valueString": filename
-                })
-                .with_limit(10000)  # Adjust if needed
-                .do()
-            )
-            
-            if result and 'data' in result and 'Get' in result['data'] and 'Document' in result['data']['Get']:
-                # Create backup filename with timestamp
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_file = self.backup_dir / f"backup_{filename}_{timestamp}.json"
-                
-                # Format the backup data
-                backup_data = {
-                    "metadata": {
-                        "filename": filename,
-                        "backup_time": timestamp,
-                        "total_chunks": len(result['data']['Get']['Document'])
-                    },
-                    "chunks": result['data']['Get']['Document']
-                }
-                
-                # Save backup with pretty printing for readability
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    json.dump(backup_data, f, indent=2, ensure_ascii=False)
-                
-                logging.info(f"Backup created for {filename} at {backup_file}")
-                return True
-        except Exception as e:
+            documents = self.client.collections.get("Document")
+
+            # Create backup filename with timestamp
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            backup_file = self.backup_dir / f"backup_{filename}_{timestamp}.jsonl.gz"
+
+            # Stream chunks out of Weaviate in pages and write compact
+            # JSONL, so memory stays constant regardless of file size.
+            page_size = 1000
+            offset = 0
+            total_chunks = 0
+
+            with gzip.open(backup_file, 'wt', encoding='utf-8') as f:
+                # Metadata goes on the first line of the stream
+                metadata = {"filename": filename, "backup_time": timestamp}
+                f.write(json.dumps(metadata, ensure_ascii=False) + "\n")
+
+                while True:
+                    result = documents.query.fetch_objects(
+                        filters=Filter.by_property("file_name").equal(filename),
+                        return_properties=["content", "page_number", "file_name", "chunk_number"],
+                        limit=page_size,
+                        offset=offset
+                    )
+
+                    for obj in result.objects:
+                        record = {**obj.properties, "_additional": {"id": str(obj.uuid)}}
+                        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+                    total_chunks += len(result.objects)
+                    if len(result.objects) < page_size:
+                        break
+                    offset += page_size
+
+            if total_chunks == 0:
+                backup_file.unlink()
+                return False
+
+            logging.info(f"Backup created for {filename} at {backup_file} ({total_chunks} chunks)")
+            return True
+        except (WeaviateBaseError, OSError) as e:
             logging.error(f"Backup creation failed for {filename}: {str(e)}")
             return False
+
+    def _create_all_backups(self):
+        """Back up all indexed documents in a single streamed query.
+
+        Iterates the collection with the cursor API, which keeps working
+        past QUERY_MAXIMUM_RESULTS where limit/offset pagination errors
+        out. Objects arrive in uuid order, so file names interleave; a
+        bounded pool of append-mode gzip handles shards the stream into
+        one backup file per PDF (reopening after eviction appends a new
+        gzip member, which reads back as one stream).
+        """
+        expected_files = set(self.list_processed_files(limit=10000))
+        started_files = set()
+
+        try:
+            documents = self.client.collections.get("Document")
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+            max_open_handles = 64
+            handles = {}
+            total_chunks = 0
+
+            try:
+                for obj in documents.iterator(
+                    return_properties=["content", "page_number", "file_name", "chunk_number"]
+                ):
+                    file_name = obj.properties['file_name']
+                    f = handles.get(file_name)
+                    if f is None:
+                        if len(handles) >= max_open_handles:
+                            _, evicted = handles.popitem()
+                            evicted.close()
+                        backup_file = self.backup_dir / f"backup_{file_name}_{timestamp}.jsonl.gz"
+                        f = gzip.open(backup_file, 'at', encoding='utf-8')
+                        handles[file_name] = f
+                        if file_name not in started_files:
+                            metadata = {"filename": file_name, "backup_time": timestamp}
+                            f.write(json.dumps(metadata, ensure_ascii=False) + "\n")
+                            started_files.add(file_name)
+
+                    record = {**obj.properties, "_additional": {"id": str(obj.uuid)}}
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    total_chunks += 1
+            finally:
+                for f in handles.values():
+                    f.close()
+
+            logging.info(f"Backed up {total_chunks} chunks across {len(started_files)} files")
+            return True
+        except (WeaviateBaseError, OSError) as e:
+            logging.error(f"Bulk backup creation failed: {str(e)}")
+            missing = sorted(expected_files - started_files)
+            if missing:
+                logging.error(f"{len(missing)} files got no backup: {missing}")
+            if started_files:
+                logging.error(
+                    f"Backups written so far may be incomplete: {sorted(started_files)}"
+                )
+            return False
         
     def process_pdf(self, pdf_path: Path) -> None:
         """Process a single PDF file with batch processing."""
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                batch = []
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    try:
-                        page = pdf_reader.pages[page_num]
-                        text = page.extract_text()
-                        
-                        if not text or not text.strip():
-                            logging.warning(f"Empty page {page_num + 1} in {pdf_path.name}")
-                            continue
-                        
-                        chunks = self._chunk_text(text)
-                        
-                        for chunk_num, chunk in enumerate(chunks):
-                            if not chunk.strip():
-                                continue
-                                
-                            properties = {
-                                "content": chunk,
-                                "page_number": page_num + 1,
-                                "file_name": str(pdf_path.name),
-                                "chunk_number": chunk_num + 1
-                            }
-                            
-                            batch.append(properties)
-                            
-                            # Process batch when it reaches the size limit
-                            if len(batch) >= self.batch_size:
-                                self._process_batch(batch)
-                                batch = []
-                        
-                    except Exception as e:
-                        logging.error(f"Error processing page {page_num + 1} in {pdf_path.name}: {str(e)}")
+            pdf = pdfium.PdfDocument(str(pdf_path))
+            try:
+                num_pages = len(pdf)
+            finally:
+                pdf.close()
+
+            tasks = ((str(pdf_path), page_num) for page_num in range(num_pages))
+
+            # Interned once per PDF; every batch of this file shares the
+            # same string object instead of re-deriving it per submission
+            pdf_name = sys.intern(pdf_path.name)
+
+            # Structure-of-arrays batch: parallel columns instead of one
+            # dict per chunk, so a 500-object batch costs three list
+            # appends per row rather than a dict plus four key slots.
+            # file_name is constant per PDF and stays out of the columns.
+            contents = []
+            page_numbers = []
+            chunk_numbers = []
+
+            # Page extraction is CPU-bound and independent per page, so fan
+            # it out across processes; batching stays single-threaded to
+            # avoid Weaviate client contention.
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for page_num, text in executor.map(_extract_page, tasks, chunksize=10):
+                    if text is None:
                         continue
-                
-                # Process remaining batch
-                if batch:
-                    self._process_batch(batch)
-                
-                # Create backup after processing the file
-                self._create_backup(pdf_path.name)
-                logging.info(f"Successfully processed {pdf_path.name}")
-                
-        except Exception as e:
+
+                    if not text.strip():
+                        logging.warning(f"Empty page {page_num + 1} in {pdf_path.name}")
+                        continue
+
+                    chunks = self._chunk_text(text)
+
+                    for chunk_num, chunk in enumerate(chunks):
+                        if not chunk.strip():
+                            continue
+
+                        contents.append(chunk)
+                        page_numbers.append(page_num + 1)
+                        chunk_numbers.append(chunk_num + 1)
+
+                        # Process batch when it reaches the size limit
+                        if len(contents) >= self._flush_size:
+                            self._process_batch(contents, page_numbers,
+                                                chunk_numbers, pdf_name)
+                            contents = []
+                            page_numbers = []
+                            chunk_numbers = []
+
+            # Process remaining batch
+            if contents:
+                self._process_batch(contents, page_numbers,
+                                    chunk_numbers, pdf_name)
+
+            logging.info(f"Successfully processed {pdf_path.name}")
+
+        except (pdfium.PdfiumError, OSError, WeaviateBaseError) as e:
             logging.error(f"Error processing {pdf_path.name}: {str(e)}")
-            logging.error(traceback.format_exc())
+        except Exception:
+            # Unknown failures are likely bugs; only these pay for a
+            # traceback, and logging formats it lazily
+            logging.error(f"Unexpected error processing {pdf_path.name}", exc_info=True)
 
-    def _process_batch(self, batch: list):
-        """Process a batch of documents."""
+    def _process_batch(self, contents: list, page_numbers: list,
+                       chunk_numbers: list, file_name: str):
+        """Process a batch of documents given as parallel columns."""
         try:
-            with self.client.batch as batch_processor:
-                batch_processor.batch_size = self.batch_size
-                
-                for properties in batch:
-                    batch_processor.add_data_object(
-                        class_name="Document",
-                        data_object=properties
+            # v4 batcher packs objects into gRPC frames and handles
+            # backpressure itself, so no throttling delay is needed.
+            # Per-object dicts are only materialized here, at submission.
+            with self._batch_context() as batch_processor:
+                for content, page_number, chunk_number in zip(
+                        contents, page_numbers, chunk_numbers):
+                    batch_processor.add_object(
+                        collection="Document",
+                        properties={
+                            "content": content,
+                            "page_number": page_number,
+                            "file_name": file_name,
+                            "chunk_number": chunk_number
+                        }
                     )
-            
-            # Small delay to prevent overwhelming the server
-            time.sleep(0.1)
-            
-        except Exception as e:
+
+            self._retry_failed_objects()
+
+            # New documents invalidate any cached search results
+            clear_search_cache()
+
+        except WeaviateBaseError as e:
             logging.error(f"Batch processing error: {str(e)}")
             raise
 
+    def _retry_failed_objects(self):
+        """Resubmit objects the server rejected, backing off between tries.
+
+        Only sleeps when something actually failed, so healthy runs pay
+        no delay at all.
+        """
+        failed = self.client.batch.failed_objects
+        backoff = 0.5
+        while failed and backoff <= 4.0:
+            logging.warning(
+                f"{len(failed)} objects failed, retrying after {backoff}s"
+            )
+            time.sleep(backoff)
+            with self._batch_context() as batch_processor:
+                for failed_obj in failed:
+                    batch_processor.add_object(
+                        collection="Document",
+                        properties=failed_obj.object_.properties
+                    )
+            failed = self.client.batch.failed_objects
+            backoff *= 2
+
+        if failed:
+            logging.error(f"{len(failed)} objects failed after retries")
+
     def process_directory(self, directory: Path = config.PDF_DIR) -> None:
         """Process all PDF files in the specified directory."""
         try:
@@ -187,20 +409,109 @@ class PDFProcessor:
                 return
                 
             logging.info(f"Found {len(pdf_files)} PDF files to process")
-            
-            with tqdm(pdf_files, desc="Processing PDFs") as pbar:
-                for pdf_file in pbar:
-                    try:
-                        self.process_pdf(pdf_file)
-                    except KeyboardInterrupt:
-                        logging.info("Processing interrupted by user")
-                        raise
-                    except Exception as e:
-                        logging.error(f"Failed to process {pdf_file.name}: {str(e)}")
-                        continue
-                    finally:
-                        pbar.update(1)
-                        
+
+            # One grouped query up front instead of a status check per file;
+            # re-ingesting an unchanged file would re-vectorize every chunk.
+            processed_files = set(self.list_processed_files(limit=10000))
+
+            pending_files = []
+            for pdf_file in pdf_files:
+                if pdf_file.name in processed_files:
+                    logging.info(f"Skipping already processed file {pdf_file.name}")
+                else:
+                    pending_files.append(pdf_file)
+
+            # Producer/consumer: worker processes extract and chunk PDFs
+            # into a bounded queue while this thread drains it into a
+            # single shared batch stream, so PDF CPU work overlaps with
+            # Weaviate network work.
+            task_queue = multiprocessing.Queue()
+            result_queue = multiprocessing.Queue(maxsize=10_000)
+
+            num_workers = min(self.max_workers, len(pending_files))
+            workers = [
+                multiprocessing.Process(
+                    target=_extract_pdf_worker,
+                    args=(task_queue, result_queue,
+                          self.chunk_size_tokens, self.chunk_overlap),
+                    daemon=True
+                )
+                for _ in range(num_workers)
+            ]
+            for worker in workers:
+                worker.start()
+
+            for pdf_file in pending_files:
+                task_queue.put(str(pdf_file))
+            for _ in workers:
+                task_queue.put(None)  # poison pill per worker
+
+            active_workers = len(workers)
+            completed_files = set()
+            with tqdm(total=len(pending_files), desc="Processing PDFs") as pbar:
+                with self._batch_context() as batch_processor:
+                    while active_workers:
+                        try:
+                            item = result_queue.get(timeout=5.0)
+                        except queue.Empty:
+                            # A worker killed outside Python (native
+                            # PDFium crash, OOM) never sends its
+                            # sentinel; once every worker is gone and
+                            # the queue has drained, the outstanding
+                            # sentinels are from such deaths
+                            if not any(worker.is_alive() for worker in workers):
+                                logging.error(
+                                    f"{active_workers} extraction worker(s) "
+                                    "died without a sentinel; aborting drain"
+                                )
+                                break
+                            continue
+                        if item is None:
+                            active_workers -= 1
+                        elif item[0] == "file_done":
+                            _, file_name, ok = item
+                            if ok:
+                                logging.info(f"Successfully processed {file_name}")
+                                completed_files.add(file_name)
+                            else:
+                                # Stays out of completed_files so the
+                                # unfinished report below flags it; any
+                                # partial chunks mean the skip gate
+                                # would otherwise hide it on reruns
+                                logging.error(f"Failed to process {file_name}")
+                            pbar.update(1)
+                        else:
+                            _, content, page_number, file_name, chunk_number = item
+                            batch_processor.add_object(
+                                collection="Document",
+                                properties={
+                                    "content": content,
+                                    "page_number": page_number,
+                                    "file_name": file_name,
+                                    "chunk_number": chunk_number
+                                }
+                            )
+
+            for worker in workers:
+                worker.join()
+
+            unfinished = [
+                pdf_file.name for pdf_file in pending_files
+                if pdf_file.name not in completed_files
+            ]
+            if unfinished:
+                logging.error(f"Files not fully ingested: {unfinished}")
+
+            self._retry_failed_objects()
+            clear_search_cache()
+
+            # With ASYNC_INDEXING the server accepts objects before the
+            # vector index has caught up; wait so search sees everything
+            self.wait_for_indexing()
+
+            # Back up everything in one stream once ingestion is done
+            self._create_all_backups()
+
         except KeyboardInterrupt:
             logging.info("Processing interrupted by user")
             raise
@@ -208,75 +519,73 @@ class PDFProcessor:
             logging.error(f"Directory processing error: {str(e)}")
             raise
 
+    def wait_for_indexing(self, poll_interval: float = 2.0, timeout: float = 600.0):
+        """Block until background vector indexing has drained."""
+        try:
+            documents = self.client.collections.get("Document")
+            deadline = time.monotonic() + timeout
+
+            while time.monotonic() < deadline:
+                shards = documents.shards()
+                if all(shard.vector_indexing_status == "READY" for shard in shards):
+                    logging.info("Vector indexing complete")
+                    return True
+                time.sleep(poll_interval)
+
+            logging.warning("Timed out waiting for vector indexing to complete")
+            return False
+        except WeaviateBaseError as e:
+            logging.error(f"Error waiting for indexing: {str(e)}")
+            return False
+
     # [Previous methods remain unchanged: get_database_stats, check_file_status, list_processed_files]
 
     def get_database_stats(self):
         """Get statistics about the database"""
         try:
+            documents = self.client.collections.get("Document")
+
             # Get total count of documents
-            result = (
-                self.client.query
-                .aggregate("Document")
-                .with_meta_count()
-                .do()
-            )
-            
-            total_docs = result['data']['Aggregate']['Document'][0]['meta']['count']
-            
+            total_docs = documents.aggregate.over_all(total_count=True).total_count
+
             # Get unique file names
-            result = (
-                self.client.query
-                .get("Document")
-                .with_additional(["id"])
-                .with_group_by(["file_name"])
-                .with_limit(10000)
-                .do()
+            result = documents.aggregate.over_all(
+                group_by=GroupByAggregate(prop="file_name")
             )
-            
-            unique_files = len(result['data']['Get']['Document'])
-            
+
+            unique_files = len(result.groups)
+
             return {
                 "total_documents": total_docs,
                 "unique_files": unique_files
             }
-        except Exception as e:
+        except WeaviateBaseError as e:
             logging.error(f"Error getting database stats: {str(e)}")
             return None
 
     def check_file_status(self, filename: str):
         """Check if a file exists in the database"""
         try:
-            result = (
-                self.client.query
-                .get("Document")
-                .with_additional(["id"])
-                .with_where({
-                    "path": ["file_name"],
-                    "operator": "Equal",
-                    "valueString": filename
-                })
-                .with_limit(1)
-                .do()
+            documents = self.client.collections.get("Document")
+            result = documents.aggregate.over_all(
+                filters=Filter.by_property("file_name").equal(filename),
+                total_count=True
             )
-            
-            return len(result['data']['Get']['Document']) > 0
-        except Exception as e:
+
+            return result.total_count > 0
+        except WeaviateBaseError as e:
             logging.error(f"Error checking file status: {str(e)}")
             return False
 
     def list_processed_files(self, limit=100):
         """List all processed files in the database"""
         try:
-            result = (
-                self.client.query
-                .get("Document")
-                .with_additional(["id"])
-                .with_group_by(["file_name"])
-                .with_limit(limit)
-                .do()
+            documents = self.client.collections.get("Document")
+            result = documents.aggregate.over_all(
+                group_by=GroupByAggregate(prop="file_name", limit=limit)
             )
-            
-            return [doc['file_name'] for doc in result['data']['Get']['Document']]
-        except Exception as e:
+
+            return [group.grouped_by.value for group in result.groups]
+        except WeaviateBaseError as e:
             logging.error(f"Error listing processed files: {str(e)}")
             return []
\ No newline at end of file
@@ -1,70 +1,85 @@
 # src/search_engine.py
 from typing import List, Dict, Any
-import weaviate
-from . import config
+from collections import OrderedDict
+from weaviate.classes.query import MetadataQuery
+from weaviate.exceptions import WeaviateBaseError
+from .weaviate_client import get_client
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
+# Repeat queries (typo corrections, navigation) are common in the
+# interactive loop; cache results so they skip embedding + HNSW entirely.
+_search_cache = OrderedDict()
+_SEARCH_CACHE_MAX = 1024
+
+def clear_search_cache():
+    """Drop cached search results; called after ingestion changes the index."""
+    _search_cache.clear()
+
 class SearchEngine:
     def __init__(self):
-        self.client = weaviate.Client(config.WEAVIATE_HOST)
-    
-    def search(self, 
-              query: str, 
-              limit: int = 5, 
+        self.client = get_client()
+
+    def search(self,
+              query: str,
+              limit: int = 5,
               min_score: float = 0.7) -> List[Dict[str, Any]]:
         """
         Perform semantic search on the document collection.
-        
+
         Args:
             query: Search query string
             limit: Maximum number of results to return
             min_score: Minimum similarity score (0-1) for results
-            
+
         Returns:
             List of matching documents with metadata
         """
+        cache_key = (query, limit, min_score)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            _search_cache.move_to_end(cache_key)
+            return cached
+
         try:
-            response = (
-                self.client.query
-                .get("Document", ["content", "page_number", "file_name", "chunk_number", "_additional {certainty}"])
-                .with_near_text({"concepts": [query]})
-                .with_limit(limit)
-                .do()
+            documents = self.client.collections.get("Document")
+            # Thresholding server-side means below-score results never
+            # leave Weaviate, and the user gets up to `limit` qualifying rows
+            response = documents.query.near_text(
+                query=query,
+                certainty=min_score,
+                limit=limit,
+                return_properties=["content", "page_number", "file_name", "chunk_number"],
+                return_metadata=MetadataQuery(certainty=True)
             )
-            
-            results = response['data']['Get']['Document']
-            
-            # Filter and format results
+
+            # Format results
             formatted_results = []
-            for r in results:
-                certainty = r['_additional']['certainty']
-                if certainty >= min_score:
-                    formatted_results.append({
-                        'content': r['content'],
-                        'page_number': r['page_number'],
-                        'file_name': r['file_name'],
-                        'chunk_number': r['chunk_number'],
-                        'relevance_score': round(certainty * 100, 2)
-                    })
-            
+            for obj in response.objects:
+                formatted_results.append({
+                    'content': obj.properties['content'],
+                    'page_number': obj.properties['page_number'],
+                    'file_name': obj.properties['file_name'],
+                    'chunk_number': obj.properties['chunk_number'],
+                    'relevance_score': round(obj.metadata.certainty * 100, 2)
+                })
+
+            _search_cache[cache_key] = formatted_results
+            if len(_search_cache) > _SEARCH_CACHE_MAX:
+                _search_cache.popitem(last=False)
+
             return formatted_results
-            
-        except Exception as e:
+
+        except WeaviateBaseError as e:
             logging.error(f"Search error: {str(e)}")
             return []
 
     def get_document_count(self) -> int:
         """Get the total number of documents in the database."""
         try:
-            response = (
-                self.client.query
-                .aggregate("Document")
-                .with_meta_count()
-                .do()
-            )
-            return response['data']['Aggregate']['Document'][0]['meta']['count']
-        except Exception as e:
+            documents = self.client.collections.get("Document")
+            return documents.aggregate.over_all(total_count=True).total_count
+        except WeaviateBaseError as e:
             logging.error(f"Error getting document count: {str(e)}")
-            return 0
\ No newline at end of file
+            return 0
@@ -0,0 +1,39 @@
+# src/weaviate_client.py
+import atexit
+import logging
+
+import weaviate
+
+from . import config
+
+_client = None
+
+def get_client():
+    """Return the shared Weaviate client, connecting on first use.
+
+    Opening a connection per operation adds handshake latency to every
+    call, so all components reuse this single connected client. It is
+    closed automatically at interpreter exit.
+    """
+    global _client
+    if _client is None:
+        # The v4 default REST session pool (20 connections, 100 max,
+        # 3 retries) already covers concurrent batch streams plus
+        # interactive queries with kept-alive connections
+        _client = weaviate.connect_to_local(
+            host=config.WEAVIATE_HOST,
+            port=config.WEAVIATE_PORT,
+            grpc_port=config.WEAVIATE_GRPC_PORT
+        )
+        atexit.register(close_client)
+    return _client
+
+def close_client():
+    """Close the shared client if it is connected."""
+    global _client
+    if _client is not None:
+        try:
+            _client.close()
+        except Exception as e:
+            logging.error(f"Error closing Weaviate client: {str(e)}")
+        _client = None